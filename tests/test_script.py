@@ -6,139 +6,179 @@ This version focuses on testing the logic rather than external dependencies
 
 import hashlib
 import os
+import re
 import shutil
 import subprocess
-import tempfile
+from pathlib import Path
 
 import pytest
 
 SCRIPT_PATH = './dnf-manager.sh'
 
+# Package categorization patterns (from the script)
+PATTERNS = {
+    'development': r'^(gcc|clang|make|cmake|git|nodejs|npm|yarn|cargo|rustc|go|java|maven|gradle)',
+    'python': r'^python',
+    'containers': r'^(docker|podman|buildah|skopeo|kubernetes|kubectl|helm)',
+    'editors': r'^(vim|emacs|neovim|code|atom|sublime)',
+    'media': r'^(vlc|mpv|ffmpeg|gimp|inkscape|blender|obs)'
+}
+
+_COMPILED_PATTERNS = {name: re.compile(p).match for name, p in PATTERNS.items()}
+
+# Sample package data - logically consistent
+MOCK_PACKAGES = {
+    'all_packages': frozenset({
+        'kernel', 'systemd', 'bash', 'coreutils', 'glibc', 'dnf',  # defaults
+        'git', 'docker-ce', 'nodejs', 'vim-enhanced',  # manually installed
+        'gcc', 'python3', 'firefox'  # auto dependencies
+    }),
+    'default_packages': frozenset({
+        'kernel', 'systemd', 'bash', 'coreutils', 'glibc', 'dnf'
+    }),
+    'user_installed': frozenset({
+        'git', 'docker-ce', 'nodejs', 'vim-enhanced'  # Only manually installed packages
+    }),
+    'manual_packages': frozenset({
+        'git', 'docker-ce', 'nodejs', 'vim-enhanced'
+    }),
+    'auto_dependencies': frozenset({
+        'gcc', 'python3', 'firefox'  # Packages that are installed but not user-requested
+    })
+}
+
+# Sorted package lists compared by the 'comm' simulation
+_COMM_LIST1 = frozenset('abcd')
+_COMM_LIST2 = frozenset('bdef')
+
+# Files written and hashed by the checksum tests, as (filename, content)
+CHECKSUM_FILES = [
+    ('test1.txt', b'git\ndocker-ce\nnodejs\n'),
+    ('test2.txt', b'gcc\npython3\n'),
+]
+
+# package-version-release.arch, where only the name may contain hyphens
+_NVRA_RE = re.compile(r'^(?P<name>.+)-(?P<version>[^-]+)-(?P<release>[^-]+)\.(?P<arch>[^.]+)$')
+
+# Lock file section header (surrounding whitespace allowed) followed by its
+# body, up to the next header
+_LOCK_SECTION_RE = re.compile(
+    r'^[ \t]*\[([^\]\r\n]+)\][ \t]*\r?$\n?'
+    r'((?:(?![ \t]*\[[^\]\r\n]+\][ \t]*\r?$).*\n?)*)',
+    re.M
+)
+
+# Minimal mock of the main script's command dispatch
+MOCK_SCRIPT_CONTENT = '''#!/bin/bash
+
+PACKAGE_DIR="${PACKAGE_DIR:-$HOME/fedora-packages}"
+mkdir -p "$PACKAGE_DIR"
+
+case "${1:-help}" in
+    help|--help|-h)
+        echo "Usage: $0 [command]"
+        echo "Commands:"
+        echo "  init - Initialize environment"
+        echo "  analyze - Analyze packages"
+        echo "  lock - Create lock file"
+        ;;
+    init)
+        echo "Initializing..."
+        echo "kernel" > "$PACKAGE_DIR/default-packages.txt"
+        echo "systemd" >> "$PACKAGE_DIR/default-packages.txt"
+        exit 0
+        ;;
+    analyze)
+        echo "Analyzing..."
+        if [ ! -f "$PACKAGE_DIR/default-packages.txt" ]; then
+            echo "Default packages not found"
+            exit 1
+        fi
+        echo "git" > "$PACKAGE_DIR/manual-packages.txt"
+        echo "docker-ce" >> "$PACKAGE_DIR/manual-packages.txt"
+        exit 0
+        ;;
+    test-fail)
+        exit 1
+        ;;
+    *)
+        echo "Unknown command: $1" >&2
+        exit 1
+        ;;
+esac
+'''
+
+
+def parse_lock_sections(text):
+    """Map each lock file section name to its stripped 'a|b|...' entries"""
+    return {
+        m.group(1): [line.strip() for line in m.group(2).splitlines() if '|' in line]
+        for m in _LOCK_SECTION_RE.finditer(text)
+    }
+
+
+def calculate_sha256(filepath):
+    """Return the hex SHA256 digest of a file"""
+    with open(filepath, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
 
 class TestFedoraPackageManagerLogic:
     """Test suite focusing on the core logic and functionality"""
     
-    @pytest.fixture
-    def temp_package_dir(self):
-        """Create a temporary package directory for testing"""
-        temp_dir = tempfile.mkdtemp()
-        yield temp_dir
-        shutil.rmtree(temp_dir)
+    @pytest.fixture(scope="session")
+    def temp_package_dir(self, tmp_path_factory):
+        """Create a temporary package directory shared across the session"""
+        # Tests that depend on directory state use their own mktemp subdirs
+        return str(tmp_path_factory.mktemp("pkgmgr"))
     
-    @pytest.fixture
+    @pytest.fixture(scope="session")
     def mock_packages(self):
         """Sample package data for testing - logically consistent"""
-        return {
-            'all_packages': [
-                'kernel', 'systemd', 'bash', 'coreutils', 'glibc', 'dnf',  # defaults
-                'git', 'docker-ce', 'nodejs', 'vim-enhanced',  # manually installed
-                'gcc', 'python3', 'firefox'  # auto dependencies
-            ],
-            'default_packages': [
-                'kernel', 'systemd', 'bash', 'coreutils', 'glibc', 'dnf'
-            ],
-            'user_installed': [
-                'git', 'docker-ce', 'nodejs', 'vim-enhanced'  # Only manually installed packages
-            ],
-            'manual_packages': [
-                'git', 'docker-ce', 'nodejs', 'vim-enhanced'
-            ],
-            'auto_dependencies': [
-                'gcc', 'python3', 'firefox'  # Packages that are installed but not user-requested
-            ]
-        }
+        return MOCK_PACKAGES
 
-    def create_mock_script(self, temp_dir):
+    @pytest.fixture(scope="session")
+    def mock_script(self, tmp_path_factory):
         """Create a minimal mock script for testing basic functionality"""
-        script_content = '''#!/bin/bash
-        
-        PACKAGE_DIR="${PACKAGE_DIR:-$HOME/fedora-packages}"
-        mkdir -p "$PACKAGE_DIR"
-        
-        case "${1:-help}" in
-            help|--help|-h)
-                echo "Usage: $0 [command]"
-                echo "Commands:"
-                echo "  init - Initialize environment"
-                echo "  analyze - Analyze packages"
-                echo "  lock - Create lock file"
-                ;;
-            init)
-                echo "Initializing..."
-                echo "kernel" > "$PACKAGE_DIR/default-packages.txt"
-                echo "systemd" >> "$PACKAGE_DIR/default-packages.txt"
-                exit 0
-                ;;
-            analyze)
-                echo "Analyzing..."
-                if [ ! -f "$PACKAGE_DIR/default-packages.txt" ]; then
-                    echo "Default packages not found"
-                    exit 1
-                fi
-                echo "git" > "$PACKAGE_DIR/manual-packages.txt"
-                echo "docker-ce" >> "$PACKAGE_DIR/manual-packages.txt"
-                exit 0
-                ;;
-            test-fail)
-                exit 1
-                ;;
-            *)
-                echo "Unknown command: $1" >&2
-                exit 1
-                ;;
-        esac
-        '''
-        
-        SCRIPT_PATH = os.path.join(temp_dir, 'test-script.sh')
-        with open(SCRIPT_PATH, 'w') as f:
-            f.write(script_content)
-        os.chmod(SCRIPT_PATH, 0o755)
-        return SCRIPT_PATH
+        script_path = tmp_path_factory.mktemp("script") / 'test-script.sh'
+        script_path.write_text(MOCK_SCRIPT_CONTENT)
+        script_path.chmod(0o755)
+        return str(script_path)
 
     def test_package_analysis_core_logic(self, mock_packages):
         """Test the core set operations for package analysis"""
-        all_packages = set(mock_packages['all_packages'])
-        default_packages = set(mock_packages['default_packages'])
-        user_installed = set(mock_packages['user_installed'])
+        all_packages = mock_packages['all_packages']
+        default_packages = mock_packages['default_packages']
+        user_installed = mock_packages['user_installed']
         
         # Core logic: manual = user_installed - defaults
         manual_packages = user_installed - default_packages
         
-        # Core logic: auto = (all - defaults) - manual
-        non_default = all_packages - default_packages
-        auto_dependencies = non_default - manual_packages
+        # Core logic: auto = (all - defaults) - manual, which equals
+        # all - defaults - user_installed since manual only drops defaults
+        auto_dependencies = all_packages - default_packages - user_installed
         
         # With our corrected mock data:
-        # user_installed = {'git', 'docker-ce', 'nodejs', 'vim-enhanced'}
-        # default_packages = {'kernel', 'systemd', 'bash', 'coreutils', 'glibc', 'dnf'}
-        # manual = user_installed - defaults = {'git', 'docker-ce', 'nodejs', 'vim-enhanced'}
-        expected_manual = {'git', 'docker-ce', 'nodejs', 'vim-enhanced'}
-        
-        # all_packages = all 13 packages
-        # non_default = all - defaults = {'git', 'docker-ce', 'nodejs', 'vim-enhanced', 'gcc', 'python3', 'firefox'}
-        # auto = non_default - manual = {'gcc', 'python3', 'firefox'}
-        expected_auto = {'gcc', 'python3', 'firefox'}
-        
-        assert manual_packages == expected_manual
-        assert auto_dependencies == expected_auto
+        # manual = {'git', 'docker-ce', 'nodejs', 'vim-enhanced'}
+        # auto = {'gcc', 'python3', 'firefox'}
+        assert manual_packages == mock_packages['manual_packages']
+        assert auto_dependencies == mock_packages['auto_dependencies']
         
         # Verify no overlaps
-        assert len(manual_packages & auto_dependencies) == 0
-        assert len(manual_packages & default_packages) == 0
+        assert not (manual_packages & auto_dependencies)
+        assert not (manual_packages & default_packages)
 
-    def test_percentage_calculations(self):
+    @pytest.mark.parametrize("numerator,denominator,expected", [
+        (10, 100, 10.0),
+        (25, 200, 12.5),
+        (1, 3, 33.3),
+        (2, 3, 66.7),
+        (0, 100, 0.0),
+    ])
+    def test_percentage_calculations(self, numerator, denominator, expected):
         """Test percentage calculation accuracy"""
-        test_cases = [
-            (10, 100, 10.0),
-            (25, 200, 12.5),
-            (1, 3, 33.3),
-            (2, 3, 66.7),
-            (0, 100, 0.0),
-        ]
-        
-        for numerator, denominator, expected in test_cases:
-            result = round((numerator * 100) / denominator, 1)
-            assert result == expected
+        result = round((numerator * 100) / denominator, 1)
+        assert result == expected
 
     def test_file_operations(self, temp_package_dir):
         """Test file creation and manipulation"""
@@ -147,11 +187,10 @@ class TestFedoraPackageManagerLogic:
         test_packages = ['git', 'docker-ce', 'nodejs']
         
         with open(test_file, 'w') as f:
-            f.write('\n'.join(test_packages))
+            f.writelines(p + '\n' for p in test_packages)
         
         # Test file reading
-        with open(test_file, 'r') as f:
-            content = f.read().strip().split('\n')
+        content = [line for line in Path(test_file).read_text().splitlines() if line]
         
         assert content == test_packages
         
@@ -164,36 +203,22 @@ class TestFedoraPackageManagerLogic:
         shutil.copy(test_file, backup_file)
         
         assert os.path.exists(backup_file)
-        with open(backup_file, 'r') as f:
-            backup_content = f.read()
-        
-        with open(test_file, 'r') as f:
-            original_content = f.read()
+        backup_content = Path(backup_file).read_text()
+        original_content = Path(test_file).read_text()
         
         assert backup_content == original_content
 
     def test_set_operations_comm_simulation(self):
         """Test set operations that simulate 'comm' command behavior"""
-        # Simulate comm -23 (in first but not second)
-        list1 = {'a', 'b', 'c', 'd'}
-        list2 = {'b', 'd', 'e', 'f'}
-        
         # comm -23: in first but not in second
-        comm_23 = list1 - list2
-        assert comm_23 == {'a', 'c'}
-        
         # comm -13: in second but not in first
-        comm_13 = list2 - list1
-        assert comm_13 == {'e', 'f'}
-        
         # comm -12: in both
-        comm_12 = list1 & list2
-        assert comm_12 == {'b', 'd'}
+        assert (_COMM_LIST1 - _COMM_LIST2, _COMM_LIST2 - _COMM_LIST1, _COMM_LIST1 & _COMM_LIST2) == (
+            frozenset('ac'), frozenset('ef'), frozenset('bd')
+        )
 
     def test_package_categorization_regex(self):
         """Test package categorization patterns"""
-        import re
-        
         test_packages = [
             'git', 'gcc', 'clang', 'make', 'cmake',  # Development
             'python3', 'python3-pip', 'python3-numpy',  # Python
@@ -202,18 +227,11 @@ class TestFedoraPackageManagerLogic:
             'vlc', 'ffmpeg', 'gimp'  # Media
         ]
         
-        # Test patterns (from the script)
-        patterns = {
-            'development': r'^(gcc|clang|make|cmake|git|nodejs|npm|yarn|cargo|rustc|go|java|maven|gradle)',
-            'python': r'^python',
-            'containers': r'^(docker|podman|buildah|skopeo|kubernetes|kubectl|helm)',
-            'editors': r'^(vim|emacs|neovim|code|atom|sublime)',
-            'media': r'^(vlc|mpv|ffmpeg|gimp|inkscape|blender|obs)'
-        }
-        
+        # Each category is counted independently, like the script's per-category
+        # grep, so a package may count towards more than one category
         results = {}
-        for category, pattern in patterns.items():
-            results[category] = len([p for p in test_packages if re.match(pattern, p)])
+        for category, matcher in _COMPILED_PATTERNS.items():
+            results[category] = sum(1 for p in test_packages if matcher(p))
         
         assert results['development'] == 5
         assert results['python'] == 3
@@ -231,18 +249,9 @@ class TestFedoraPackageManagerLogic:
         
         def parse_version_string(version_str):
             # Simulate parsing package-version-release.arch format
-            parts = version_str.rsplit('.', 1)  # Split arch
-            if len(parts) == 2:
-                name_version_release = parts[0]
-                arch = parts[1]
-                
-                # Split version-release from name (find last two hyphens)
-                components = name_version_release.split('-')
-                if len(components) >= 3:
-                    name = '-'.join(components[:-2])
-                    version = components[-2]
-                    release = components[-1]
-                    return name, version, release, arch
+            m = _NVRA_RE.match(version_str)
+            if m:
+                return m['name'], m['version'], m['release'], m['arch']
             return None, None, None, None
         
         expected = [
@@ -255,54 +264,56 @@ class TestFedoraPackageManagerLogic:
             result = parse_version_string(version_str)
             assert result == expected[i]
 
-    def test_checksum_calculation(self, temp_package_dir):
+    @pytest.mark.parametrize("filename,content", CHECKSUM_FILES, ids=['test1', 'test2'])
+    def test_checksum_calculation(self, tmp_path_factory, filename, content):
         """Test SHA256 checksum calculation"""
-        def calculate_sha256(filepath):
-            sha256_hash = hashlib.sha256()
-            with open(filepath, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
-        
-        # Create test files
-        test_file1 = os.path.join(temp_package_dir, 'test1.txt')
-        test_file2 = os.path.join(temp_package_dir, 'test2.txt')
-        
-        with open(test_file1, 'w') as f:
-            f.write('git\ndocker-ce\nnodejs\n')
-        
-        with open(test_file2, 'w') as f:
-            f.write('gcc\npython3\n')
+        test_file = tmp_path_factory.mktemp("checksum") / filename
+        Path(test_file).write_bytes(content)
+        checksum = calculate_sha256(test_file)
         
-        checksum1 = calculate_sha256(test_file1)
-        checksum2 = calculate_sha256(test_file2)
-        
-        # Verify checksums are different
-        assert checksum1 != checksum2
-        
-        # Verify checksum consistency
-        checksum1_again = calculate_sha256(test_file1)
-        assert checksum1 == checksum1_again
+        # Verify checksum consistency with an independent in-memory hash
+        assert checksum == hashlib.sha256(content).hexdigest()
         
         # Verify checksum length (SHA256 is 64 hex chars)
-        assert len(checksum1) == 64
-        assert len(checksum2) == 64
+        assert len(checksum) == 64
+
+    def test_checksums_unique(self):
+        """Test that different contents produce different checksums"""
+        # test_checksum_calculation ties calculate_sha256 to hashlib.sha256,
+        # so uniqueness is checked on the in-memory digests
+        checksums = {hashlib.sha256(content).hexdigest() for _, content in CHECKSUM_FILES}
+        assert len(checksums) == len(CHECKSUM_FILES)
 
-    def test_mock_script_basic_functionality(self, temp_package_dir):
+    def test_mock_script_basic_functionality(self, tmp_path, mock_script):
         """Test basic script functionality with mock"""
-        SCRIPT_PATH = self.create_mock_script(temp_package_dir)
+        # Fresh per-test directory: analyze-before-init needs no defaults yet
+        package_dir = str(tmp_path / 'packages')
+        # Minimal environment keeps the envp passed to execve small and the
+        # run hermetic
+        env = {
+            'PATH': os.environ.get('PATH', ''),
+            'HOME': os.environ.get('HOME', ''),
+            'PACKAGE_DIR': package_dir,
+        }
         
         # Test help command
-        result = subprocess.run([SCRIPT_PATH, 'help'], capture_output=True, text=True)
+        result = subprocess.run(
+            [mock_script, 'help'], env=env, capture_output=True, text=True, timeout=10
+        )
         assert result.returncode == 0
         assert 'Usage:' in result.stdout
         
-        # Test init command
-        package_dir = os.path.join(temp_package_dir, 'packages')
-        env = os.environ.copy()
-        env['PACKAGE_DIR'] = package_dir
+        # Test analyze command before init
+        result = subprocess.run(
+            [mock_script, 'analyze'], env=env, capture_output=True, text=True, timeout=10
+        )
+        assert result.returncode == 1
+        assert 'Default packages not found' in result.stdout
         
-        result = subprocess.run([SCRIPT_PATH, 'init'], env=env, capture_output=True, text=True)
+        # Test init command
+        result = subprocess.run(
+            [mock_script, 'init'], env=env, capture_output=True, text=True, timeout=10
+        )
         assert result.returncode == 0
         
         # Check that files were created
@@ -310,14 +321,18 @@ class TestFedoraPackageManagerLogic:
         assert os.path.exists(default_file)
         
         # Test analyze command
-        result = subprocess.run([SCRIPT_PATH, 'analyze'], env=env, capture_output=True, text=True)
+        result = subprocess.run(
+            [mock_script, 'analyze'], env=env, capture_output=True, text=True, timeout=10
+        )
         assert result.returncode == 0
         
         manual_file = os.path.join(package_dir, 'manual-packages.txt')
         assert os.path.exists(manual_file)
         
         # Test invalid command
-        result = subprocess.run([SCRIPT_PATH, 'invalid'], capture_output=True, text=True)
+        result = subprocess.run(
+            [mock_script, 'invalid'], env=env, capture_output=True, text=True, timeout=10
+        )
         assert result.returncode == 1
         assert 'Unknown command' in result.stderr
 
@@ -348,21 +363,12 @@ manual_packages|abc123def456
 auto_dependencies|def456ghi789
 """
         
-        with open(lock_file, 'w') as f:
-            f.write(lock_content)
+        Path(lock_file).write_text(lock_content)
         
         # Test parsing
-        sections = {}
-        current_section = None
-        
-        with open(lock_file, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('[') and line.endswith(']'):
-                    current_section = line[1:-1]
-                    sections[current_section] = []
-                elif current_section and '|' in line:
-                    sections[current_section].append(line)
+        text = Path(lock_file).read_text()
+        
+        sections = parse_lock_sections(text)
         
         # Verify structure
         assert 'MANUAL_PACKAGES' in sections
@@ -376,35 +382,46 @@ auto_dependencies|def456ghi789
         assert len(sections['REPOSITORIES']) == 2
         assert len(sections['CHECKSUMS']) == 2
 
+    @pytest.mark.parametrize("text", [
+        '[A]\r\na|1\r\n[B]\r\nb|2\r\n',
+        '[A]\na|1\n[B]\nb|2',
+    ], ids=['crlf', 'no-trailing-newline'])
+    def test_lock_file_line_endings(self, text):
+        """Test lock file parsing with CRLF endings or no final newline"""
+        assert parse_lock_sections(text) == {'A': ['a|1'], 'B': ['b|2']}
+        
+        # A trailing header with no body is still a section
+        assert parse_lock_sections(text.rstrip() + '\n[C]') == {
+            'A': ['a|1'], 'B': ['b|2'], 'C': []
+        }
+
     def test_parallel_processing_logic(self):
         """Test parallel processing concepts without actual parallelization"""
-        # Simulate chunking packages for parallel processing
-        packages = [f'package-{i}' for i in range(100)]
+        # Simulate chunking packages for parallel processing; chunks are
+        # ranges of package indices
+        total_packages = 100
         chunk_size = 25
         
         # Create chunks
-        chunks = [packages[i:i + chunk_size] for i in range(0, len(packages), chunk_size)]
+        chunks = [
+            range(i, min(i + chunk_size, total_packages))
+            for i in range(0, total_packages, chunk_size)
+        ]
         
         assert len(chunks) == 4  # 100 packages / 25 per chunk
         assert len(chunks[0]) == 25
         assert len(chunks[-1]) == 25  # Last chunk should also have 25
-        assert chunks[0][0] == 'package-0'
-        assert chunks[-1][-1] == 'package-99'
-        
-        # Simulate progress tracking
-        total_packages = len(packages)
-        processed = 0
-        
-        for chunk in chunks:
-            # Simulate processing chunk
-            chunk_processed = len(chunk)
-            processed += chunk_processed
-            
-            # Calculate progress
-            progress_percent = (processed * 100) // total_packages
-            
+        assert chunks[0][0] == 0
+        assert chunks[-1][-1] == 99
+        
+        # Simulate progress tracking: every package lands in exactly one chunk
+        processed = sum(len(chunk) for chunk in chunks)
+        
         assert processed == total_packages
-        assert progress_percent == 100
+        
+        # Progress after each chunk; a chunk's stop is the running total
+        progress = [(chunk.stop * 100) // total_packages for chunk in chunks]
+        assert progress == [25, 50, 75, 100]
 
     def test_environment_variable_handling(self, temp_package_dir):
         """Test environment variable handling logic"""
@@ -421,34 +438,35 @@ auto_dependencies|def456ghi789
         assert get_package_dir() == default_dir
         assert get_package_dir(custom_dir) == custom_dir
 
-    @pytest.mark.parametrize("total,processed,expected_percent", [
-        (100, 0, 0),
-        (100, 25, 25),
-        (100, 50, 50),
-        (100, 100, 100),
-        (1000, 333, 33),
-        (7, 3, 42),  # Test rounding
-    ])
-    def test_progress_calculations(self, total, processed, expected_percent):
+    def test_progress_calculations(self):
         """Test progress percentage calculations"""
-        result = (processed * 100) // total
-        assert result == expected_percent
+        totals = [100, 100, 100, 100, 1000, 7]
+        processed = [0, 25, 50, 100, 333, 3]
+        expected_percents = [0, 25, 50, 100, 33, 42]  # 7, 3 tests rounding
+        
+        results = [(p * 100) // t for p, t in zip(processed, totals, strict=True)]
+        assert results == expected_percents
 
 
 class TestScriptIntegration:
     """Integration tests that require the actual script"""
     
-    def test_script_exists_and_executable(self):
+    @pytest.fixture(scope="session")
+    def script_exists(self):
+        """Check once whether the main script exists (only this is cached)"""
+        return os.path.exists(SCRIPT_PATH)
+    
+    def test_script_exists_and_executable(self, script_exists):
         """Test if the main script exists and is executable"""
-        if not os.path.exists(SCRIPT_PATH):
+        if not script_exists:
             pytest.skip("Main script not found - this is expected in test environment")
         
         # Check if executable
         assert os.access(SCRIPT_PATH, os.X_OK)
     
-    def test_help_command_real_script(self):
+    def test_help_command_real_script(self, script_exists):
         """Test help command on real script if available"""
-        if not os.path.exists(SCRIPT_PATH):
+        if not script_exists:
             pytest.skip("Main script not found")
         
         try: